@@ -2,8 +2,23 @@ from config.init import *
 import os
 from pathlib import Path
 
+# Database driver: 'pymssql' (default) or 'pyodbc', overridable in init.py
+DB_DRIVER = globals().get('DB_DRIVER', 'pymssql')
+
 # Database configuration
-DATABASE_URL = f"mssql+pymssql://{DB_USERNAME}:{DB_PASSWORD}@{DB_SERVER}/{DB_DATABASE}"
+if DB_DRIVER == "pyodbc":
+    DATABASE_URL = (
+        f"mssql+pyodbc://{DB_USERNAME}:{DB_PASSWORD}@{DB_SERVER}/{DB_DATABASE}"
+        "?driver=ODBC+Driver+18+for+SQL+Server"
+    )
+else:
+    DATABASE_URL = f"mssql+pymssql://{DB_USERNAME}:{DB_PASSWORD}@{DB_SERVER}/{DB_DATABASE}"
+
+# Database connection pool configuration
+DB_POOL_SIZE = 5         # Connections kept open in the pool
+DB_MAX_OVERFLOW = 2      # Extra connections allowed beyond pool size
+DB_POOL_TIMEOUT = 30     # Seconds to wait for a free connection
+DB_POOL_RECYCLE = 1800   # Recycle connections after 30 minutes
 
 # Email configuration
 EMAIL_CONFIG = {
@@ -21,10 +36,14 @@ EMAIL_CONFIG = {
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 SQL_QUERIES_PATH = PROJECT_ROOT / "immunization_query.sql"
 LOGS_PATH = PROJECT_ROOT / "logs"
+CACHE_PATH = PROJECT_ROOT / "cache"
 
 # Ensure logs directory exists
 LOGS_PATH.mkdir(exist_ok=True)
 
+# Query result cache configuration
+CACHE_TTL_HOURS = 12  # Reuse same-day query results younger than this
+
 # Logging configuration
 LOG_CONFIG = {
     'filename': LOGS_PATH / 'immunization_automation.log',
@@ -3,6 +3,7 @@ DB_SERVER = "your-sql-server.domain.com"
 DB_DATABASE = "your_database_name"
 DB_USERNAME = "your_username"
 DB_PASSWORD = "your_password"
+DB_DRIVER = "pymssql"  # Or "pyodbc" (requires pyodbc and ODBC Driver 18 for SQL Server)
 
 # Email credentials
 SMTP_SERVER = "smtp.yourdomain.com"
@@ -1,7 +1,14 @@
 import logging
 from sqlalchemy import create_engine, text
 from sqlalchemy.exc import SQLAlchemyError
-from config.config import DATABASE_URL
+from sqlalchemy.sql.elements import TextClause
+from config.config import (
+    DATABASE_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE
+)
 import time
 
 logger = logging.getLogger('immunization_automation.database')
@@ -18,9 +25,16 @@ class DatabaseManager:
         try:
             self.engine = create_engine(
                 DATABASE_URL,
-                pool_pre_ping=True,  # Verify connections before use
-                pool_recycle=3600,   # Recycle connections after 1 hour
-                echo=False           # Set to True for SQL debugging
+                pool_size=DB_POOL_SIZE,
+                max_overflow=DB_MAX_OVERFLOW,
+                pool_timeout=DB_POOL_TIMEOUT,
+                pool_recycle=DB_POOL_RECYCLE,
+                pool_pre_ping=True,   # Verify connections before use
+                pool_use_lifo=True,   # Reuse warm connections, let idle ones expire
+                future=True,
+                query_cache_size=1200,  # Keep compiled statements across calls
+                isolation_level='AUTOCOMMIT',  # Read-only workload; skip BEGIN/COMMIT round-trips
+                echo=False            # Set to True for SQL debugging
             )
             logger.info("Database engine initialized successfully")
         except Exception as e:
@@ -42,24 +56,24 @@ class DatabaseManager:
         Execute a SQL query with retry logic.
         
         Args:
-            query (str): SQL query to execute
+            query (str or TextClause): SQL query to execute, or a pre-built TextClause
             parameters (dict, optional): Query parameters
             
         Returns:
-            list: Query results as list of dictionaries
+            list: Query results as list of row mappings
         """
+        statement = query if isinstance(query, TextClause) else text(query)
+        
         for attempt in range(self.max_retries):
             try:
                 with self.engine.connect() as connection:
                     if parameters:
-                        result = connection.execute(text(query), parameters)
+                        result = connection.execute(statement, parameters)
                     else:
-                        result = connection.execute(text(query))
+                        result = connection.execute(statement)
                     
-                    # Convert result to list of dictionaries
-                    columns = result.keys()
-                    rows = result.fetchall()
-                    return [dict(zip(columns, row)) for row in rows]
+                    # RowMapping views over the fetched rows; no dict is built per row
+                    return result.mappings().all()
                     
             except SQLAlchemyError as e:
                 logger.warning(f"Database query attempt {attempt + 1} failed: {e}")
@@ -1,5 +1,8 @@
+import hashlib
 import logging
+from functools import cached_property
 from pathlib import Path
+from sqlalchemy import text, bindparam
 from config.config import SQL_QUERIES_PATH
 from utils.school_year import get_current_school_year
 
@@ -8,29 +11,48 @@ logger = logging.getLogger('immunization_automation.queries')
 class QueryManager:
     def __init__(self):
         self.sql_file_path = SQL_QUERIES_PATH
+        self._compiled = None
+    
+    @cached_property
+    def _query_text(self):
+        """Contents of the SQL query file, read once on first access."""
+        return self.sql_file_path.read_text(encoding='utf-8')
+    
+    def get_query_hash(self):
+        """
+        Get a short fingerprint of the SQL query file contents.
+        
+        Returns:
+            str: First 12 hex digits of the SHA-256 of the query text
+        """
+        return hashlib.sha256(self._query_text.encode('utf-8')).hexdigest()[:12]
     
     def load_immunization_query(self, school_year=None):
         """
         Load and parameterize the immunization query from the SQL file.
         
+        The SQL file is read once and the resulting TextClause is reused on
+        subsequent calls, so SQLAlchemy can serve it from its compiled cache.
+        
         Args:
             school_year (int, optional): School year to use. If None, uses current school year.
             
         Returns:
-            str: Parameterized SQL query
+            TextClause: Parameterized SQL query
         """
         if school_year is None:
             school_year = get_current_school_year()
         
         logger.info(f"Loading immunization query for school year {school_year}")
         
+        if self._compiled is not None:
+            return self._compiled
+        
         try:
-            with open(self.sql_file_path, 'r', encoding='utf-8') as file:
-                query_template = file.read()
-            
             # SQL file already contains :school_year parameter
+            self._compiled = text(self._query_text).bindparams(bindparam('school_year'))
             logger.info("Immunization query loaded successfully")
-            return query_template
+            return self._compiled
             
         except FileNotFoundError:
             logger.error(f"SQL query file not found: {self.sql_file_path}")
@@ -73,11 +95,9 @@ class QueryManager:
                 return False
             
             # Try to read the file
-            with open(self.sql_file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-                if not content.strip():
-                    logger.error("SQL query file is empty")
-                    return False
+            if not self._query_text.strip():
+                logger.error("SQL query file is empty")
+                return False
             
             logger.info("SQL query file validation successful")
             return True
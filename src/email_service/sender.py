@@ -1,46 +1,71 @@
 import logging
 import smtplib
-import pandas as pd
+import csv
+import gzip
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
-from email import encoders
-from io import BytesIO, StringIO
+from email.mime.application import MIMEApplication
+from io import BytesIO, TextIOWrapper
 from datetime import datetime
 from config.config import EMAIL_CONFIG
-from utils.school_year import get_school_year_string
+from utils.school_year import get_current_school_year, get_school_year_string
 
 logger = logging.getLogger('immunization_automation.email')
 
+# Report email body; filled in with str.format_map by create_email_message
+EMAIL_BODY_TEMPLATE = """Dear Staff,
+
+Please find attached the Immunization Report for school year {school_year}.
+
+Report Details:
+- Generated: {generated}
+- Records: {records}
+- School Year: {school_year}
+- Format: Gzip-compressed CSV (Comma-Separated Values)
+
+This report contains active student roster data for immunization tracking, excluding students without an SSID and students enrolled in program 696.
+
+Extract the .csv.gz attachment (e.g. with 7-Zip) to get the CSV file, which can be opened in Excel, Google Sheets, or any spreadsheet application for processing.
+
+Please process this data according to our immunization compliance procedures via the Immunization Portal.
+
+https://your-immunization-portal.gov/surveys/
+
+Best regards,
+Immunization Automation System"""
+
 class EmailSender:
     def __init__(self):
         self.config = EMAIL_CONFIG
 
     def create_csv_attachment(self, data, filename=None):
         """
-        Create CSV file from query results.
+        Create gzip-compressed CSV file from query results.
 
         Args:
-            data (list): Query results as list of dictionaries
+            data (list): Query results as list of row mappings
             filename (str, optional): Filename for the attachment
 
         Returns:
-            BytesIO: CSV file as bytes
+            BytesIO: Gzip-compressed CSV file as bytes
         """
         if not data:
             logger.warning("No data provided for CSV attachment")
             return None
 
         try:
-            # Convert to DataFrame
-            df = pd.DataFrame(data)
-
-            # Create CSV file in memory
-            csv_buffer = StringIO()
-            df.to_csv(csv_buffer, index=False, encoding='utf-8')
-
-            # Convert StringIO to BytesIO for attachment
-            csv_bytes = BytesIO(csv_buffer.getvalue().encode('utf-8'))
+            # Write CSV text through a gzip stream into the byte buffer; closing
+            # the gzip stream writes its trailer but leaves the buffer open
+            csv_bytes = BytesIO()
+            with gzip.GzipFile(fileobj=csv_bytes, mode='wb', compresslevel=6) as gzip_file:
+                text_wrapper = TextIOWrapper(gzip_file, encoding='utf-8', newline='')
+                try:
+                    writer = csv.DictWriter(text_wrapper, fieldnames=list(data[0].keys()))
+                    writer.writeheader()
+                    writer.writerows(data)
+                finally:
+                    # Flush and detach so the wrapper never closes the gzip stream itself
+                    text_wrapper.detach()
             csv_bytes.seek(0)
 
             logger.info(f"CSV attachment created with {len(data)} records")
@@ -62,10 +87,10 @@ class EmailSender:
             MIMEMultipart: Email message object
         """
         if school_year is None:
-            from utils.school_year import get_current_school_year
             school_year = get_current_school_year()
 
         school_year_str = get_school_year_string(school_year)
+        generated_at = datetime.now()
 
         # Create message
         msg = MIMEMultipart()
@@ -74,28 +99,11 @@ class EmailSender:
         msg['Subject'] = f"Immunization Report - {school_year_str}"
 
         # Email body
-        body = f"""
-Dear Staff,
-
-Please find attached the Immunization Report for school year {school_year_str}.
-
-Report Details:
-- Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-- Records: {len(data) if data else 0}
-- School Year: {school_year_str}
-- Format: CSV (Comma-Separated Values)
-
-This report contains active student roster data for immunization tracking, excluding students without an SSID and students enrolled in program 696.
-
-The CSV file can be opened in Excel, Google Sheets, or any spreadsheet application for processing.
-
-Please process this data according to our immunization compliance procedures via the Immunization Portal.
-
-https://your-immunization-portal.gov/surveys/
-
-Best regards,
-Immunization Automation System
-        """.strip()
+        body = EMAIL_BODY_TEMPLATE.format_map({
+            'school_year': school_year_str,
+            'generated': generated_at.strftime('%Y-%m-%d %H:%M:%S'),
+            'records': len(data) if data else 0
+        })
 
         msg.attach(MIMEText(body, 'plain'))
 
@@ -103,11 +111,9 @@ Immunization Automation System
         if data:
             csv_buffer = self.create_csv_attachment(data)
             if csv_buffer:
-                attachment = MIMEBase('application', 'csv')
-                attachment.set_payload(csv_buffer.read())
-                encoders.encode_base64(attachment)
+                attachment = MIMEApplication(csv_buffer.getvalue(), _subtype='gzip')
 
-                filename = f"Immunization_Report_{school_year_str}_{datetime.now().strftime('%Y%m%d')}.csv"
+                filename = f"Immunization_Report_{school_year_str}_{generated_at.strftime('%Y%m%d')}.csv.gz"
                 attachment.add_header(
                     'Content-Disposition',
                     f'attachment; filename= {filename}'
@@ -143,11 +149,12 @@ Immunization Automation System
                 if self.config.get('use_auth', True):
                     server.login(self.config['username'], self.config['password'])
 
-                text = msg.as_string()
-                server.sendmail(
-                    self.config['from_email'],
-                    self.config['recipients'],
-                    text
+                # send_message serializes straight to bytes, avoiding an
+                # intermediate str copy of the whole base64-encoded message
+                server.send_message(
+                    msg,
+                    from_addr=self.config['from_email'],
+                    to_addrs=self.config['recipients']
                 )
 
             logger.info(f"Email sent successfully to {len(self.config['recipients'])} recipients")
@@ -21,9 +21,11 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from utils.logging_setup import setup_logging
 from utils.school_year import get_current_school_year, validate_school_year, get_school_year_string
-from database.connection import DatabaseManager
-from database.queries import QueryManager
-from email_service.sender import EmailSender
+from utils.cache import CacheManager
+
+# Database and email modules pull in SQLAlchemy and the SQL Server driver, so
+# they are imported inside the functions that use them to keep --help and
+# --test-email startup fast.
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -48,6 +50,11 @@ def parse_arguments():
         action='store_true', 
         help='Run query but do not send email'
     )
+    parser.add_argument(
+        '--no-cache', 
+        action='store_true', 
+        help="Ignore today's cached query results and query the database"
+    )
     
     return parser.parse_args()
 
@@ -75,13 +82,14 @@ def test_email_connection(email_sender):
         logger.error("Email connection test: FAILED")
         return False
 
-def run_immunization_report(school_year=None, dry_run=False):
+def run_immunization_report(school_year=None, dry_run=False, use_cache=True):
     """
     Run the complete immunization report process.
     
     Args:
         school_year (int, optional): School year to process
         dry_run (bool): If True, run query but don't send email
+        use_cache (bool): If True, reuse today's cached query results when fresh
         
     Returns:
         bool: True if successful, False otherwise
@@ -89,10 +97,15 @@ def run_immunization_report(school_year=None, dry_run=False):
     logger = logging.getLogger('immunization_automation.main')
     
     try:
+        from database.connection import DatabaseManager
+        from database.queries import QueryManager
+        from email_service.sender import EmailSender
+        
         # Initialize components
         db_manager = DatabaseManager()
         query_manager = QueryManager()
         email_sender = EmailSender()
+        cache_manager = CacheManager()
         
         # Determine school year
         if school_year is None:
@@ -104,22 +117,24 @@ def run_immunization_report(school_year=None, dry_run=False):
         
         logger.info(f"Processing immunization report for school year {get_school_year_string(school_year)}")
         
-        # Validate query file
-        if not query_manager.validate_query_file():
-            logger.error("Query file validation failed")
-            return False
-        
-        # Test database connection
-        if not test_database_connection(db_manager):
-            return False
-        
-        # Load and execute query
-        logger.info("Loading and executing immunization query...")
-        query = query_manager.load_immunization_query(school_year)
-        parameters = query_manager.get_query_parameters(school_year)
+        # Reuse today's query results if a fresh cache exists
+        query_hash = query_manager.get_query_hash()
+        data = cache_manager.load(school_year, query_hash) if use_cache else None
         
-        data = db_manager.execute_query(query, parameters)
-        logger.info(f"Query executed successfully, retrieved {len(data)} records")
+        if data is not None:
+            logger.info(f"Using cached query results, {len(data)} records")
+        else:
+            # Load and execute query; a missing query file or unreachable
+            # database surfaces here as an exception
+            logger.info("Loading and executing immunization query...")
+            query = query_manager.load_immunization_query(school_year)
+            parameters = query_manager.get_query_parameters(school_year)
+            
+            data = db_manager.execute_query(query, parameters)
+            logger.info(f"Query executed successfully, retrieved {len(data)} records")
+            
+            if data:
+                cache_manager.save(school_year, query_hash, data)
         
         if not data:
             logger.warning("No data returned from query - this may indicate an issue")
@@ -166,12 +181,16 @@ def main():
             overall_success = True
             
             if args.test_db:
+                from database.connection import DatabaseManager
+                from database.queries import QueryManager
+                query_success = QueryManager().validate_query_file()
                 db_manager = DatabaseManager()
                 db_success = test_database_connection(db_manager)
                 db_manager.close()
-                overall_success = overall_success and db_success
+                overall_success = overall_success and query_success and db_success
             
             if args.test_email:
+                from email_service.sender import EmailSender
                 email_sender = EmailSender()
                 email_success = test_email_connection(email_sender)
                 overall_success = overall_success and email_success
@@ -181,7 +200,8 @@ def main():
         # Run the main process
         success = run_immunization_report(
             school_year=args.school_year,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            use_cache=not args.no_cache
         )
         
         if success:
@@ -0,0 +1,104 @@
+import gzip
+import logging
+import pickle
+import time
+from datetime import datetime
+from config.config import CACHE_PATH, CACHE_TTL_HOURS
+
+logger = logging.getLogger('immunization_automation.cache')
+
+class CacheManager:
+    def __init__(self, cache_dir=CACHE_PATH, ttl_hours=CACHE_TTL_HOURS):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_hours * 3600
+    
+    def _cache_file(self, school_year, query_hash):
+        """Cache file path for the given school year, query and today's date."""
+        date_str = datetime.now().strftime('%Y%m%d')
+        return self.cache_dir / f"roster_{school_year}_{date_str}_{query_hash}.pkl.gz"
+    
+    def load(self, school_year, query_hash):
+        """
+        Load cached query results for today, if present and fresh.
+        
+        Args:
+            school_year (int): School year of the cached report
+            query_hash (str): Fingerprint of the SQL query that produced the results
+            
+        Returns:
+            list: Cached query results as list of dictionaries, or None on a miss
+        """
+        cache_file = self._cache_file(school_year, query_hash)
+        
+        try:
+            if not cache_file.is_file():
+                return None
+            
+            age = time.time() - cache_file.stat().st_mtime
+            if age > self.ttl_seconds:
+                logger.info(f"Cached query results are stale ({age / 3600:.1f} hours old)")
+                return None
+            
+            data = pickle.loads(gzip.decompress(cache_file.read_bytes()))
+            logger.info(f"Loaded {len(data)} records from cache: {cache_file}")
+            return data
+            
+        except Exception as e:
+            logger.warning(f"Failed to load cached query results: {e}")
+            return None
+    
+    def save(self, school_year, query_hash, data):
+        """
+        Save query results to today's cache file and remove older cache files.
+        
+        Args:
+            school_year (int): School year of the report
+            query_hash (str): Fingerprint of the SQL query that produced the results
+            data (list): Query results as list of row mappings
+            
+        Returns:
+            bool: True if saved successfully, False otherwise
+        """
+        cache_file = self._cache_file(school_year, query_hash)
+        
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            
+            # Row mappings are tied to the result set, so store plain dictionaries
+            payload = pickle.dumps([dict(row) for row in data], protocol=pickle.HIGHEST_PROTOCOL)
+            
+            # Write to a temporary file first so readers never see a partial cache
+            temp_file = cache_file.with_suffix('.tmp')
+            temp_file.write_bytes(gzip.compress(payload))
+            temp_file.replace(cache_file)
+            
+            logger.info(f"Saved {len(data)} records to cache: {cache_file}")
+            self._remove_stale_files(school_year, cache_file)
+            return True
+            
+        except Exception as e:
+            logger.warning(f"Failed to save query results to cache: {e}")
+            return False
+    
+    def _remove_stale_files(self, school_year, current_file):
+        """
+        Delete cached rosters from earlier days, and today's rosters for this
+        school year that were produced by a different query.
+        """
+        today = datetime.now().strftime('%Y%m%d')
+        
+        for cache_file in self.cache_dir.glob('roster_*'):
+            if cache_file == current_file:
+                continue
+            
+            parts = cache_file.name.split('_')
+            if len(parts) < 4:
+                continue
+            
+            file_year, file_date = parts[1], parts[2]
+            if file_date != today or file_year == str(school_year):
+                try:
+                    cache_file.unlink()
+                    logger.info(f"Removed stale cache file: {cache_file}")
+                except OSError as e:
+                    logger.warning(f"Failed to remove stale cache file {cache_file}: {e}")
\ No newline at end of file
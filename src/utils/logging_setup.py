@@ -1,9 +1,22 @@
+import atexit
 import logging
 import logging.handlers
+import queue
 from config.config import LOG_CONFIG
 
+# Background listener that writes queued log records to the real handlers
+_listener = None
+
 def setup_logging():
-    """Setup logging configuration for the application."""
+    """
+    Setup logging configuration for the application.
+    
+    Records are placed on a queue by the logger and written to the file and
+    console handlers by a background listener thread, so logging calls do not
+    block on disk I/O or log rotation.
+    """
+    global _listener
+    
     logger = logging.getLogger('immunization_automation')
     logger.setLevel(getattr(logging, LOG_CONFIG['level']))
     
@@ -11,6 +24,9 @@ def setup_logging():
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
     
+    # Stop a listener left over from a previous setup
+    _stop_listener()
+    
     # Create rotating file handler
     file_handler = logging.handlers.RotatingFileHandler(
         LOG_CONFIG['filename'],
@@ -28,8 +44,27 @@ def setup_logging():
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Route records through a queue to the handlers on a background thread
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
-    return logger
\ No newline at end of file
+    _listener = logging.handlers.QueueListener(
+        log_queue,
+        file_handler,
+        console_handler,
+        respect_handler_level=True
+    )
+    _listener.start()
+    
+    return logger
+
+def _stop_listener():
+    """Flush queued log records and stop the background listener."""
+    global _listener
+    
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+# Flush queued records at interpreter exit; registered once per process
+atexit.register(_stop_listener)
\ No newline at end of file
@@ -1,10 +1,13 @@
+import functools
 from datetime import datetime
 from config.config import SCHOOL_YEAR_START_MONTH, SCHOOL_YEAR_START_DAY
 
+@functools.lru_cache(maxsize=1)
 def get_current_school_year():
     """
     Calculate the current school year based on today's date.
     School year starts September 1st and ends August 31st.
+    The result is cached for the lifetime of the process.
     
     Returns:
         int: The current school year (e.g., 2024 for 2024-2025 school year)
@@ -20,6 +23,7 @@ def get_current_school_year():
     else:
         return current_year
 
+@functools.lru_cache(maxsize=1)
 def get_school_year_string(year=None):
     """
     Get formatted school year string.